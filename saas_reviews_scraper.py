@@ -9,16 +9,32 @@ Output: JSON array of review objects
 """
 
 import argparse
-import json
+import codecs
+import functools
 import logging
+import os
+import queue
 import re
 import sys
-from datetime import datetime
-from typing import Dict, List, Optional
-from urllib.parse import quote_plus, urljoin
+import threading
+import time
+from abc import ABC, abstractmethod
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from urllib.parse import quote_plus, urljoin, urlsplit
 
+import lxml.etree
+import lxml.html
+import orjson
 import requests
-from bs4 import BeautifulSoup
+import requests_cache
+from dateutil import parser as date_parser
+from requests.adapters import HTTPAdapter
+from selectolax.lexbor import LexborHTMLParser
+from urllib3.util.retry import Retry
 
 # Configure logging
 logging.basicConfig(
@@ -29,11 +45,104 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _class_selector(tags: Tuple[str, ...], keywords: Tuple[str, ...]) -> str:
+    """Build a CSS selector matching any of the tags whose class contains any keyword"""
+    return ', '.join(f'{tag}[class*="{keyword}" i]' for tag in tags for keyword in keywords)
+
+
+def _product_link_xpath(marker: str) -> str:
+    """
+    Build an XPath selecting the href of the first link containing a path marker.
+    
+    Equivalent to matching hrefs against ``<marker>[^/]+``, but evaluated
+    by lxml in C and stopping at the first hit.
+    """
+    rest = f"substring-after(@href, '{marker}')"
+    return f"(//a[contains(@href, '{marker}') and {rest} != '' and not(starts-with({rest}, '/'))])[1]/@href"
+
+
+def _rules_selector(rules: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...]) -> str:
+    """Build a single CSS selector matching the nodes of every field rule"""
+    return ', '.join(_class_selector(tags, keywords) for _, tags, keywords in rules)
+
+
+# On-disk HTTP cache so re-runs and retries are served without hitting the network
+CACHE_NAME = 'scraper_cache'
+CACHE_EXPIRE_AFTER = timedelta(hours=6)
+
+# Conservative per-host request rate; exceeding a site's threshold triggers
+# dropped connections and retries that lower effective throughput
+REQUESTS_PER_SECOND_PER_HOST = 0.5
+
+# Review field rules: (field, tags, class keywords), keywords matched case-insensitively.
+# The date is looked up separately (DATE_SELECTOR) before the remaining fields.
+REVIEW_FIELD_RULES = (
+    ('title', ('h3', 'h4', 'div'), ('title', 'heading')),
+    ('description', ('div',), ('description', 'text', 'content', 'body')),
+    ('reviewer', ('span', 'div', 'a'), ('author', 'reviewer', 'name')),
+    ('rating', ('span', 'div'), ('rating', 'star')),
+)
+CAPTERRA_FIELD_RULES = REVIEW_FIELD_RULES[:2] + (
+    ('reviewer', ('span', 'div', 'a'), ('author', 'reviewer', 'name', 'user')),
+) + REVIEW_FIELD_RULES[3:]
+
+# Selectors and patterns shared by all scrapers, built once at import time
+DATE_SELECTOR = _class_selector(('time', 'span', 'div'), ('date', 'time'))
+REVIEW_FIELDS_SELECTOR = _rules_selector(REVIEW_FIELD_RULES)
+CAPTERRA_FIELDS_SELECTOR = _rules_selector(CAPTERRA_FIELD_RULES)
+
+PRODUCT_LINK_XPATH = _product_link_xpath('/products/')
+CAPTERRA_PRODUCT_LINK_XPATH = _product_link_xpath('/reviews/')
+NUMERIC_RATING_RE = re.compile(r'(\d+(?:\.\d+)?)')
+
+
 class ScrapingError(Exception):
     """Custom exception for scraping errors"""
     pass
 
 
+class RequestCancelled(requests.RequestException):
+    """Raised when a request waiting for a rate limit slot is cancelled"""
+    pass
+
+
+@dataclass
+class Review:
+    """A single scraped review, serialized field by field to the output JSON"""
+    
+    # Explicit slots keep per-review memory low and fields fixed
+    __slots__ = ('source', 'title', 'description', 'review_date', 'reviewer_name', 'rating')
+    
+    source: str
+    title: str
+    description: str
+    review_date: str
+    reviewer_name: str
+    rating: str
+
+
+@dataclass(frozen=True)
+class SiteConfig:
+    """URLs and parsing rules for one review site"""
+    
+    # Source name recorded on each review, e.g. 'G2'
+    name: str
+    base_url: str
+    # Search path relative to base_url, formatted with the quoted company name as {query}
+    search_path: str
+    # Selects the href of the first product link in search results
+    product_link_xpath: str
+    # Reviews page relative to the product URL
+    reviews_path: str
+    # Appended to the reviews URL, formatted with the page number as {page}
+    pagination: str
+    # CSS selector matching review container elements on a result page
+    review_selector: str
+    # Rules locating fields inside a review element, and their combined selector
+    field_rules: Tuple[Tuple[str, Tuple[str, ...], Tuple[str, ...]], ...] = REVIEW_FIELD_RULES
+    fields_selector: str = REVIEW_FIELDS_SELECTOR
+
+
 def validate_dates(start_date: str, end_date: str) -> tuple:
     """
     Validate and parse date strings.
@@ -60,10 +169,96 @@ def validate_dates(start_date: str, end_date: str) -> tuple:
     return start, end
 
 
+MONTH_NAMES = (
+    'january', 'february', 'march', 'april', 'may', 'june',
+    'july', 'august', 'september', 'october', 'november', 'december',
+)
+# Full and abbreviated month names, lower-cased, mapped to month numbers
+MONTHS = {
+    **{name: number for number, name in enumerate(MONTH_NAMES, start=1)},
+    **{name[:3]: number for number, name in enumerate(MONTH_NAMES, start=1)},
+}
+
+# Date layouts used by review platforms, matched with a single pattern:
+#   2023-03-15 [14:30:00]          (ISO variants without a "T" are matched here)
+#   March 15, 2023 / Mar 15, 2023 [2:30 PM]
+#   03/15/2023 or 15/03/2023       (month first, then day first)
+#   15-03-2023 or 03-15-2023       (day first, then month first)
+#   15 March 2023 / 15 Mar 2023
+DATE_PATTERN = re.compile(
+    r'(?P<iso_year>\d{4})-(?P<iso_month>\d{1,2})-(?P<iso_day>\d{1,2})'
+    r'(?:\s+(?P<hour24>\d{1,2}):(?P<minute24>\d{1,2}):(?P<second24>\d{1,2}))?'
+    r'|(?P<name_month>[A-Za-z]+)\s+(?P<name_day>\d{1,2}),?\s+(?P<name_year>\d{4})'
+    r'(?:\s+(?P<hour12>\d{1,2}):(?P<minute12>\d{1,2})\s*(?P<ampm>[AaPp][Mm]))?'
+    r'|(?P<slash_a>\d{1,2})/(?P<slash_b>\d{1,2})/(?P<slash_year>\d{4})'
+    r'|(?P<dash_a>\d{1,2})-(?P<dash_b>\d{1,2})-(?P<dash_year>\d{4})'
+    r'|(?P<day_first_day>\d{1,2})\s+(?P<day_first_month>[A-Za-z]+)\s+(?P<day_first_year>\d{4})'
+)
+
+# dateutil fills missing components from its default datetime; a date that
+# parses the same under two defaults differing in year, month and day is complete
+DATEUTIL_DEFAULTS = (datetime(2000, 1, 1), datetime(2001, 2, 2))
+
+
+def _date_from_match(match: 're.Match') -> Optional[datetime]:
+    """
+    Build a datetime from a DATE_PATTERN match.
+    
+    Args:
+        match: Match object returned by DATE_PATTERN.fullmatch
+    
+    Returns:
+        datetime object or None if the components do not form a valid date
+    """
+    groups = match.groupdict()
+    hour = minute = second = 0
+    
+    if groups['iso_year']:
+        candidates = [(groups['iso_year'], groups['iso_month'], groups['iso_day'])]
+        if groups['hour24']:
+            hour, minute, second = int(groups['hour24']), int(groups['minute24']), int(groups['second24'])
+    elif groups['name_year']:
+        month = MONTHS.get(groups['name_month'].lower())
+        if month is None:
+            return None
+        candidates = [(groups['name_year'], month, groups['name_day'])]
+        if groups['hour12']:
+            hour, minute = int(groups['hour12']), int(groups['minute12'])
+            if not 1 <= hour <= 12:
+                return None
+            hour = hour % 12 + (12 if groups['ampm'].lower() == 'pm' else 0)
+    elif groups['slash_year']:
+        year, first, last = groups['slash_year'], groups['slash_a'], groups['slash_b']
+        candidates = [(year, first, last), (year, last, first)]
+    elif groups['dash_year']:
+        year, first, last = groups['dash_year'], groups['dash_a'], groups['dash_b']
+        candidates = [(year, last, first), (year, first, last)]
+    else:
+        month = MONTHS.get(groups['day_first_month'].lower())
+        if month is None:
+            return None
+        candidates = [(groups['day_first_year'], month, groups['day_first_day'])]
+    
+    for year, month, day in candidates:
+        try:
+            return datetime(int(year), int(month), int(day), hour, minute, second)
+        except ValueError:
+            continue
+    
+    return None
+
+
+@functools.lru_cache(maxsize=2048)
 def parse_date(date_str: str) -> Optional[datetime]:
     """
     Parse various date formats commonly found in review sites.
     
+    Known layouts are recognized by a single DATE_PATTERN match; anything
+    else falls back to dateutil, which must find a year, month and day in
+    the string. Timezone offsets are dropped so results
+    compare with the naive start/end dates. Results are memoized, as
+    reviews on the same page often share a date.
+    
     Args:
         date_str: Date string in various formats
     
@@ -75,33 +270,27 @@ def parse_date(date_str: str) -> Optional[datetime]:
     
     date_str = date_str.strip()
     
-    # Common date formats used by review platforms
-    date_formats = [
-        '%Y-%m-%d',
-        '%Y-%m-%d %H:%M:%S',
-        '%B %d, %Y',
-        '%b %d, %Y',
-        '%B %d, %Y %I:%M %p',
-        '%b %d, %Y %I:%M %p',
-        '%m/%d/%Y',
-        '%d/%m/%Y',
-        '%d-%m-%Y',
-        '%m-%d-%Y',
-        '%d %B %Y',
-        '%d %b %Y',
-    ]
-    
-    for fmt in date_formats:
+    # ISO dates such as <time datetime="..."> values always start with the year;
+    # the C implementation of fromisoformat is much cheaper than strptime
+    if date_str[:4].isdigit():
         try:
-            return datetime.strptime(date_str, fmt)
-        except (ValueError, AttributeError):
-            continue
+            return datetime.fromisoformat(date_str.replace('Z', '+00:00')).replace(tzinfo=None)
+        except ValueError:
+            pass
+    
+    match = DATE_PATTERN.fullmatch(date_str)
+    if match:
+        parsed = _date_from_match(match)
+        if parsed:
+            return parsed
     
-    # Try ISO format variants
     try:
-        return datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-    except (ValueError, AttributeError):
+        first, second = (date_parser.parse(date_str, default=default) for default in DATEUTIL_DEFAULTS)
+    except (ValueError, OverflowError):
         pass
+    else:
+        if first == second:
+            return first.replace(tzinfo=None)
     
     # For relative dates like "2 months ago", we skip them as they're not accurate
     # In production, you might want to convert these using dateutil.relativedelta
@@ -109,505 +298,595 @@ def parse_date(date_str: str) -> Optional[datetime]:
     return None
 
 
-class BaseScraper:
-    """Base class for review scrapers"""
-    
-    BASE_URL = ""
-    
-    def __init__(self, company_name: str, start_date: datetime, end_date: datetime):
-        self.company_name = company_name
-        self.start_date = start_date
-        self.end_date = end_date
-        self.session = requests.Session()
-        self.session.headers.update({
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-        })
+def response_encoding(response: requests.Response) -> str:
+    """
+    Get the charset declared in a response's Content-Type header.
     
-    def search_company(self) -> Optional[str]:
-        """Search for company - to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement search_company")
+    Review sites serve UTF-8 almost exclusively, so a missing or unknown
+    charset defaults to UTF-8 rather than triggering encoding detection.
     
-    def scrape_reviews(self) -> List[Dict]:
-        """Scrape reviews - to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement scrape_reviews")
+    Args:
+        response: HTTP response
     
-    def _parse_review(self, element) -> Optional[Dict]:
-        """Parse review element - to be implemented by subclasses"""
-        raise NotImplementedError("Subclasses must implement _parse_review")
+    Returns:
+        Normalized codec name, e.g. 'utf-8'
+    """
+    content_type = response.headers.get('Content-Type', '')
+    for param in content_type.split(';')[1:]:
+        key, _, value = param.partition('=')
+        if key.strip().lower() == 'charset':
+            try:
+                return codecs.lookup(value.strip().strip('"\'')).name
+            except LookupError:
+                break
+    return 'utf-8'
 
 
-class G2Scraper(BaseScraper):
-    """Scraper for G2 reviews"""
+class RateLimiter:
+    """Thread-safe fixed-interval rate limiter"""
     
-    BASE_URL = "https://www.g2.com"
+    def __init__(self, requests_per_second: float):
+        self.interval = 1.0 / requests_per_second
+        self.next_time = 0.0
+        self._lock = threading.Lock()
     
-    def search_company(self) -> Optional[str]:
+    def wait(self, cancelled: Optional[threading.Event] = None) -> bool:
         """
-        Search for the company on G2 and return the product URL.
+        Block until the next request slot is available.
+        
+        Args:
+            cancelled: Event that aborts the wait when set
         
         Returns:
-            Product URL or None if not found
+            False if the wait was aborted, True otherwise
         """
-        search_url = f"{self.BASE_URL}/search?query={quote_plus(self.company_name)}"
+        with self._lock:
+            now = time.monotonic()
+            delay = max(0.0, self.next_time - now)
+            self.next_time = max(now, self.next_time) + self.interval
         
-        try:
-            response = self.session.get(search_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Look for product links in search results
-            # G2 typically has links like /products/[product-name]
-            product_links = soup.find_all('a', href=re.compile(r'/products/[^/]+'))
-            
-            if product_links:
-                # Take the first matching product
-                product_path = product_links[0].get('href')
-                return urljoin(self.BASE_URL, product_path)
-            
-            logger.error(f"Company '{self.company_name}' not found on G2")
-            return None
-            
-        except requests.RequestException as e:
-            logger.error(f"Error searching for company on G2: {e}")
-            return None
+        if delay:
+            if cancelled is None:
+                time.sleep(delay)
+            elif cancelled.wait(delay):
+                return False
+        return True
+
+
+# Per-thread request state: page fetch threads set ``cancelled`` to an Event
+# that aborts their request while it waits for a rate limit slot
+_request_context = threading.local()
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that spaces out requests to each host with a RateLimiter.
     
-    def scrape_reviews(self) -> List[Dict]:
-        """
-        Scrape all reviews for the company within the date range.
+    Rate limiting at the transport level means responses served from the
+    HTTP cache never wait for a request slot.
+    """
+    
+    def __init__(self, requests_per_second: float, **kwargs):
+        self.requests_per_second = requests_per_second
+        self._limiters: Dict[str, RateLimiter] = {}
+        self._limiters_lock = threading.Lock()
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        host = urlsplit(request.url).netloc
+        with self._limiters_lock:
+            limiter = self._limiters.get(host)
+            if limiter is None:
+                limiter = self._limiters[host] = RateLimiter(self.requests_per_second)
         
-        Returns:
-            List of review dictionaries
+        if not limiter.wait(getattr(_request_context, 'cancelled', None)):
+            raise RequestCancelled(f"Request cancelled: {request.url}", request=request)
+        return super().send(request, **kwargs)
+
+
+_shared_session: Optional[requests_cache.CachedSession] = None
+_parse_pool: Optional[ProcessPoolExecutor] = None
+# Page fetch threads of several scrapers may request the pool at once
+_parse_pool_lock = threading.Lock()
+
+
+def _get_shared_session() -> requests_cache.CachedSession:
+    """
+    Return the HTTP session shared by all scrapers, creating it on first use.
+    
+    Sharing one session keeps connections alive across scraper instances,
+    rate limits requests per host and retries transient failures with
+    exponential backoff.
+    """
+    global _shared_session
+    if _shared_session is None:
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            backend='sqlite',
+            expire_after=CACHE_EXPIRE_AFTER,
+            stale_if_error=True
+        )
+        # The default Accept-Encoding header already advertises brotli ('br')
+        # alongside gzip/deflate when the brotli package is installed
+        session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+        })
+        adapter = RateLimitedAdapter(
+            REQUESTS_PER_SECOND_PER_HOST,
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _shared_session = session
+    return _shared_session
+
+
+def _get_parse_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for parsing, creating it on first use"""
+    global _parse_pool
+    with _parse_pool_lock:
+        if _parse_pool is None:
+            _parse_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _parse_pool
+
+
+def _parse_page_bytes(site: SiteConfig, content: bytes, encoding: str, start_date: datetime,
+                      end_date: datetime) -> Tuple[List[Review], bool, bool]:
+    """
+    Parse a result page in a worker process.
+    
+    Kept at module level so it can be pickled by ProcessPoolExecutor.
+    
+    Args:
+        site: Configuration of the site the page belongs to
+        content: Raw HTML of the result page
+        encoding: Charset of content, as returned by response_encoding
+        start_date: Start date for filtering
+        end_date: End date for filtering
+    
+    Returns:
+        Tuple of (reviews within the date range, whether the page had any
+        dated reviews, whether a review before start_date was reached)
+    """
+    return ReviewScraper._parse_page(site, content, encoding, start_date, end_date)
+
+
+class BaseScraper(ABC):
+    """Base class for review scrapers"""
+    
+    # Number of result pages fetched ahead of the page being processed
+    MAX_PAGES_AHEAD = 8
+    
+    def __init__(self, company_name: str, start_date: datetime, end_date: datetime,
+                 refresh_cache: bool = False):
+        self.company_name = company_name
+        # Constant for the scraper's lifetime, so encode it once
+        self._encoded_company = quote_plus(company_name)
+        self.start_date = start_date
+        self.end_date = end_date
+        self.session = _get_shared_session()
+        # Per-request headers, since the session is shared between scrapers
+        self.request_headers: Dict[str, str] = {}
+        if refresh_cache:
+            # Force revalidation of cached pages with the origin server
+            self.request_headers['Cache-Control'] = 'max-age=0'
+        # Set by cancel(); _fetch_stop belongs to the pagination in progress
+        self._cancelled = threading.Event()
+        self._fetch_stop: Optional[threading.Event] = None
+    
+    def cancel(self):
         """
-        reviews = []
-        product_url = self.search_company()
+        Stop a running scrape_reviews from another thread.
         
-        if not product_url:
-            raise ScrapingError(f"Could not find company '{self.company_name}' on G2")
+        Pages not fetched yet are skipped and a request waiting for a rate
+        limit slot is aborted, after which scrape_reviews returns.
+        """
+        self._cancelled.set()
+        stop = self._fetch_stop
+        if stop is not None:
+            stop.set()
+    
+    def _get(self, url: str) -> requests.Response:
+        """
+        Fetch a URL with the scraper session.
         
-        # Navigate to reviews page
-        reviews_url = urljoin(product_url, 'reviews')
-        page = 1
+        Args:
+            url: URL to fetch
         
-        while True:
-            try:
-                # G2 uses pagination with page parameter
-                paginated_url = f"{reviews_url}?page={page}"
-                logger.info(f"Scraping G2 page {page}...")
-                
-                response = self.session.get(paginated_url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements - this selector may need adjustment based on actual G2 structure
-                review_elements = soup.find_all('div', class_=re.compile(r'review|Review'))
-                
-                if not review_elements:
-                    logger.info(f"No more reviews found on page {page}")
-                    break
-                
-                page_reviews = []
-                for element in review_elements:
-                    review = self._parse_review(element)
-                    if review:
-                        review_date = review.get('review_date')
-                        if review_date:
-                            review_dt = parse_date(review_date)
-                            if review_dt:
-                                # If review is before start_date, stop scraping
-                                if review_dt < self.start_date:
-                                    logger.info(f"Reached reviews before start_date, stopping pagination")
-                                    return reviews
-                                
-                                # Only include reviews within date range
-                                if self.start_date <= review_dt <= self.end_date:
-                                    page_reviews.append(review)
-                
-                if not page_reviews:
-                    logger.info(f"No reviews in date range on page {page}, stopping")
-                    break
-                
-                reviews.extend(page_reviews)
-                page += 1
-                
-            except requests.RequestException as e:
-                logger.error(f"Error scraping G2 page {page}: {e}")
-                break
+        Returns:
+            Response object
         
-        return reviews
+        Raises:
+            requests.RequestException: On network errors or non-2xx status
+        """
+        response = self.session.get(url, headers=self.request_headers, timeout=10)
+        response.raise_for_status()
+        return response
     
-    def _parse_review(self, element) -> Optional[Dict]:
+    def _fetch_pages(self, page_url: Callable[[int], str]) -> Iterator[Tuple[int, Future]]:
         """
-        Parse a single review element.
+        Fetch paginated result pages in the background and parse them concurrently.
+        
+        A single thread fetches pages one after another, so requests reach
+        the rate limiter in page order, and hands each page to the parse
+        pool. It runs at most MAX_PAGES_AHEAD pages ahead of the
+        caller. Once the caller stops iterating or cancel() is called,
+        fetching stops, including a request still waiting for a rate limit
+        slot.
         
         Args:
-            element: BeautifulSoup element containing review data
+            page_url: Callable returning the URL for a page number
         
-        Returns:
-            Review dictionary or None
+        Yields:
+            Tuple of (page number, future resolving to the parsed page as
+            returned by _parse_page)
         """
-        try:
-            review = {
-                'source': 'G2',
-                'title': '',
-                'description': '',
-                'review_date': '',
-                'reviewer_name': '',
-                'rating': ''
-            }
-            
-            # Extract title
-            title_elem = element.find(['h3', 'h4', 'div'], class_=re.compile(r'title|heading', re.I))
-            if title_elem:
-                review['title'] = title_elem.get_text(strip=True)
-            
-            # Extract description
-            desc_elem = element.find('div', class_=re.compile(r'description|text|content|body', re.I))
-            if desc_elem:
-                review['description'] = desc_elem.get_text(strip=True)
-            
-            # Extract date
-            date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
-            if date_elem:
-                review['review_date'] = date_elem.get_text(strip=True)
-                # Check datetime attribute
-                if date_elem.get('datetime'):
-                    review['review_date'] = date_elem.get('datetime')
-            
-            # Extract reviewer name
-            reviewer_elem = element.find(['span', 'div', 'a'], class_=re.compile(r'author|reviewer|name', re.I))
-            if reviewer_elem:
-                review['reviewer_name'] = reviewer_elem.get_text(strip=True)
-            
-            # Extract rating
-            rating_elem = element.find(['span', 'div'], class_=re.compile(r'rating|star', re.I))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                # Extract numeric rating
-                rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
-                if rating_match:
-                    review['rating'] = rating_match.group(1)
-            
-            # Only return review if it has at least title or description
-            if review['title'] or review['description']:
-                return review
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error parsing review element: {e}")
-            return None
+        fetched: queue.Queue = queue.Queue()
+        slots = threading.Semaphore(self.MAX_PAGES_AHEAD)
+        stop = threading.Event()
+        self._fetch_stop = stop
+        if self._cancelled.is_set():
+            stop.set()
+        
+        def fetch():
+            _request_context.cancelled = stop
+            page = 1
+            try:
+                while True:
+                    slots.acquire()
+                    if stop.is_set():
+                        return
+                    try:
+                        future = self._fetch_and_parse(page_url(page))
+                    except Exception as e:
+                        if stop.is_set():
+                            return
+                        # Hand the error to the caller, which stops at this page
+                        future = Future()
+                        future.set_exception(e)
+                        fetched.put((page, future))
+                        return
+                    fetched.put((page, future))
+                    page += 1
+            finally:
+                # Tell the caller that no more pages are coming
+                fetched.put(None)
+        
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(fetch)
+            try:
+                while True:
+                    item = fetched.get()
+                    if item is None:
+                        return
+                    yield item
+                    slots.release()
+            finally:
+                stop.set()
+                slots.release()
+                # Pages fetched ahead are no longer needed
+                while not fetched.empty():
+                    item = fetched.get()
+                    if item is not None:
+                        item[1].cancel()
+    
+    @abstractmethod
+    def search_company(self) -> Optional[str]:
+        """Search for the company and return its product URL"""
+    
+    @abstractmethod
+    def scrape_reviews(self) -> Iterator[Review]:
+        """Scrape reviews within the date range"""
+    
+    @abstractmethod
+    def _fetch_and_parse(self, url: str) -> Future:
+        """Fetch a result page and return a future resolving to its parsed content"""
 
 
-class CapterraScraper(BaseScraper):
-    """Scraper for Capterra reviews"""
+class ReviewScraper(BaseScraper):
+    """Scraper for any review site described by a SiteConfig"""
     
-    BASE_URL = "https://www.capterra.com"
+    def __init__(self, site: SiteConfig, company_name: str, start_date: datetime,
+                 end_date: datetime, refresh_cache: bool = False):
+        super().__init__(company_name, start_date, end_date, refresh_cache)
+        self.site = site
     
     def search_company(self) -> Optional[str]:
         """
-        Search for the company on Capterra and return the product URL.
+        Search for the company on the site and return the product URL.
         
         Returns:
             Product URL or None if not found
         """
-        search_url = f"{self.BASE_URL}/search?utf8=✓&query={quote_plus(self.company_name)}"
+        site = self.site
+        search_url = site.base_url + site.search_path.format(query=self._encoded_company)
         
         try:
-            response = self.session.get(search_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            response = self._get(search_url)
             
-            # Look for product links in search results
-            product_links = soup.find_all('a', href=re.compile(r'/reviews/[^/]+'))
+            # Take the first product link in search results
+            product_paths = []
+            content = response.content
+            encoding = response_encoding(response)
+            if encoding != 'utf-8':
+                # libxml2 does not know every Python codec name, so transcode
+                # other charsets instead of passing the name on
+                content = content.decode(encoding, errors='replace').encode('utf-8')
+            parser = lxml.html.HTMLParser(encoding='utf-8')
+            try:
+                tree = lxml.html.fromstring(content, parser=parser)
+            except lxml.etree.ParserError:
+                # Raised for bodies without any element (empty, whitespace or comments only)
+                pass
+            else:
+                product_paths = tree.xpath(site.product_link_xpath)
             
-            if product_links:
-                product_path = product_links[0].get('href')
-                return urljoin(self.BASE_URL, product_path)
+            if product_paths:
+                return urljoin(site.base_url, product_paths[0])
             
-            logger.error(f"Company '{self.company_name}' not found on Capterra")
+            logger.error(f"Company '{self.company_name}' not found on {site.name}")
             return None
             
         except requests.RequestException as e:
-            logger.error(f"Error searching for company on Capterra: {e}")
+            logger.error(f"Error searching for company on {site.name}: {e}")
             return None
     
-    def scrape_reviews(self) -> List[Dict]:
+    def scrape_reviews(self) -> Iterator[Review]:
         """
         Scrape all reviews for the company within the date range.
         
-        Returns:
-            List of review dictionaries
+        Reviews are yielded page by page as they are scraped.
+        
+        Yields:
+            Review objects
         """
-        reviews = []
+        site = self.site
         product_url = self.search_company()
         
         if not product_url:
-            raise ScrapingError(f"Could not find company '{self.company_name}' on Capterra")
+            raise ScrapingError(f"Could not find company '{self.company_name}' on {site.name}")
         
-        # Navigate to reviews section
-        reviews_url = urljoin(product_url, '#reviews')
-        page = 1
+        # Navigate to reviews page; pages are fetched ahead in the background and processed in order
+        # Only the site's own pagination suffix is a format string; the scraped URL may contain braces
+        reviews_url = urljoin(product_url, site.reviews_path)
+        pages = self._fetch_pages(lambda p: reviews_url + site.pagination.format(page=p))
         
-        while True:
-            try:
-                # Capterra uses pagination
-                paginated_url = f"{product_url}?page={page}#reviews"
-                logger.info(f"Scraping Capterra page {page}...")
-                
-                response = self.session.get(paginated_url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements
-                review_elements = soup.find_all('div', class_=re.compile(r'review|comment', re.I))
-                
-                if not review_elements:
-                    logger.info(f"No more reviews found on page {page}")
+        with closing(pages):
+            for page, future in pages:
+                try:
+                    logger.info(f"Scraping {site.name} page {page}...")
+                    page_reviews, has_dates, reached_start = future.result()
+                except requests.RequestException as e:
+                    logger.error(f"Error scraping {site.name} page {page}: {e}")
                     break
                 
-                page_reviews = []
-                for element in review_elements:
-                    review = self._parse_review(element)
-                    if review:
-                        review_date = review.get('review_date')
-                        if review_date:
-                            review_dt = parse_date(review_date)
-                            if review_dt:
-                                if review_dt < self.start_date:
-                                    logger.info(f"Reached reviews before start_date, stopping pagination")
-                                    return reviews
-                                
-                                if self.start_date <= review_dt <= self.end_date:
-                                    page_reviews.append(review)
+                yield from page_reviews
                 
-                if not page_reviews:
-                    logger.info(f"No reviews in date range on page {page}, stopping")
+                if reached_start:
+                    logger.info("Reached reviews before start_date, stopping pagination")
                     break
                 
-                reviews.extend(page_reviews)
-                page += 1
-                
-            except requests.RequestException as e:
-                logger.error(f"Error scraping Capterra page {page}: {e}")
-                break
-        
-        return reviews
+                # Pages entirely newer than end_date are skipped, not treated as the end
+                if not has_dates:
+                    logger.info(f"No dated reviews on page {page}, stopping")
+                    break
     
-    def _parse_review(self, element) -> Optional[Dict]:
+    def _fetch_and_parse(self, url: str) -> Future:
         """
-        Parse a single review element.
+        Fetch a result page and submit it to the process pool for parsing.
         
         Args:
-            element: BeautifulSoup element containing review data
+            url: URL of the result page
         
         Returns:
-            Review dictionary or None
+            Future resolving to a tuple of (reviews within the date range,
+            whether the page had any dated reviews, whether a review before
+            start_date was reached)
         """
-        try:
-            review = {
-                'source': 'Capterra',
-                'title': '',
-                'description': '',
-                'review_date': '',
-                'reviewer_name': '',
-                'rating': ''
-            }
-            
-            # Extract title
-            title_elem = element.find(['h3', 'h4', 'div'], class_=re.compile(r'title|heading', re.I))
-            if title_elem:
-                review['title'] = title_elem.get_text(strip=True)
-            
-            # Extract description
-            desc_elem = element.find('div', class_=re.compile(r'description|text|content|body|review-text', re.I))
-            if desc_elem:
-                review['description'] = desc_elem.get_text(strip=True)
-            
-            # Extract date
-            date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
-            if date_elem:
-                review['review_date'] = date_elem.get_text(strip=True)
-                if date_elem.get('datetime'):
-                    review['review_date'] = date_elem.get('datetime')
-            
-            # Extract reviewer name
-            reviewer_elem = element.find(['span', 'div', 'a'], class_=re.compile(r'author|reviewer|name|user', re.I))
-            if reviewer_elem:
-                review['reviewer_name'] = reviewer_elem.get_text(strip=True)
-            
-            # Extract rating
-            rating_elem = element.find(['span', 'div'], class_=re.compile(r'rating|star', re.I))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
-                if rating_match:
-                    review['rating'] = rating_match.group(1)
-            
-            if review['title'] or review['description']:
-                return review
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error parsing review element: {e}")
-            return None
-
-
-class TrustRadiusScraper(BaseScraper):
-    """Scraper for TrustRadius reviews (Bonus source)"""
-    
-    BASE_URL = "https://www.trustradius.com"
+        response = self._get(url)
+        return _get_parse_pool().submit(
+            _parse_page_bytes, self.site, response.content, response_encoding(response),
+            self.start_date, self.end_date
+        )
     
-    def search_company(self) -> Optional[str]:
+    @staticmethod
+    def _parse_page(site: SiteConfig, content: bytes, encoding: str, start_date: datetime,
+                    end_date: datetime) -> Tuple[List[Review], bool, bool]:
         """
-        Search for the company on TrustRadius and return the product URL.
+        Parse a result page and filter its reviews by date range.
+        
+        Reviews are listed newest first, so parsing stops at the first
+        review older than start_date. Only the date is extracted up front;
+        the remaining fields are parsed for reviews within the date range.
+        
+        Args:
+            site: Configuration of the site the page belongs to
+            content: Raw HTML of the result page
+            encoding: Charset of content, as returned by response_encoding
+            start_date: Start date for filtering
+            end_date: End date for filtering
         
         Returns:
-            Product URL or None if not found
+            Tuple of (reviews within the date range, whether the page had any
+            dated reviews, whether a review before start_date was reached)
         """
-        search_url = f"{self.BASE_URL}/search?q={quote_plus(self.company_name)}"
+        # The charset is already known: Lexbor reads bytes as UTF-8 without
+        # detection, and other charsets are decoded up front
+        if encoding == 'utf-8':
+            tree = LexborHTMLParser(content)
+        else:
+            tree = LexborHTMLParser(content.decode(encoding, errors='replace'))
+        page_reviews = []
+        has_dates = False
         
-        try:
-            response = self.session.get(search_url, timeout=10)
-            response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+        for element in tree.css(site.review_selector):
+            review_date = ReviewScraper._extract_date_only(element)
+            if not review_date:
+                continue
             
-            # Look for product links
-            product_links = soup.find_all('a', href=re.compile(r'/products/[^/]+'))
+            review_dt = parse_date(review_date)
+            if not review_dt:
+                continue
             
-            if product_links:
-                product_path = product_links[0].get('href')
-                return urljoin(self.BASE_URL, product_path)
+            has_dates = True
             
-            logger.error(f"Company '{self.company_name}' not found on TrustRadius")
-            return None
+            # If review is before start_date, stop scraping
+            if review_dt < start_date:
+                return page_reviews, has_dates, True
             
-        except requests.RequestException as e:
-            logger.error(f"Error searching for company on TrustRadius: {e}")
-            return None
+            # Only parse reviews within date range
+            if review_dt > end_date:
+                continue
+            
+            review = ReviewScraper._parse_review_full(site, element, review_date)
+            if review:
+                page_reviews.append(review)
+        
+        return page_reviews, has_dates, False
     
-    def scrape_reviews(self) -> List[Dict]:
+    @staticmethod
+    def _extract_date_only(element) -> str:
         """
-        Scrape all reviews for the company within the date range.
+        Extract just the date of a review element.
+        
+        Args:
+            element: selectolax node containing review data
         
         Returns:
-            List of review dictionaries
+            Review date string, or an empty string if none was found
         """
-        reviews = []
-        product_url = self.search_company()
+        # css() also matches the element itself; only descendants count
+        for date_elem in element.css(DATE_SELECTOR):
+            if date_elem.mem_id != element.mem_id:
+                # Prefer the machine-readable datetime attribute
+                return date_elem.attributes.get('datetime') or date_elem.text(strip=True)
         
-        if not product_url:
-            raise ScrapingError(f"Could not find company '{self.company_name}' on TrustRadius")
+        return ''
+    
+    @staticmethod
+    def _find_fields(site: SiteConfig, element) -> Dict:
+        """
+        Locate the first node for each review field in a single subtree query.
         
-        # Navigate to reviews page
-        reviews_url = urljoin(product_url, 'reviews')
-        page = 1
+        Args:
+            site: Configuration providing the field rules
+            element: selectolax node containing review data
         
-        while True:
-            try:
-                paginated_url = f"{reviews_url}?page={page}"
-                logger.info(f"Scraping TrustRadius page {page}...")
-                
-                response = self.session.get(paginated_url, timeout=10)
-                response.raise_for_status()
-                soup = BeautifulSoup(response.content, 'html.parser')
-                
-                # Find review elements
-                review_elements = soup.find_all('div', class_=re.compile(r'review|Review', re.I))
-                
-                if not review_elements:
-                    logger.info(f"No more reviews found on page {page}")
-                    break
-                
-                page_reviews = []
-                for element in review_elements:
-                    review = self._parse_review(element)
-                    if review:
-                        review_date = review.get('review_date')
-                        if review_date:
-                            review_dt = parse_date(review_date)
-                            if review_dt:
-                                if review_dt < self.start_date:
-                                    logger.info(f"Reached reviews before start_date, stopping pagination")
-                                    return reviews
-                                
-                                if self.start_date <= review_dt <= self.end_date:
-                                    page_reviews.append(review)
-                
-                if not page_reviews:
-                    logger.info(f"No reviews in date range on page {page}, stopping")
-                    break
-                
-                reviews.extend(page_reviews)
-                page += 1
-                
-            except requests.RequestException as e:
-                logger.error(f"Error scraping TrustRadius page {page}: {e}")
+        Returns:
+            Dictionary mapping field names from site.field_rules to their nodes
+        """
+        fields = {}
+        
+        for node in element.css(site.fields_selector):
+            # css() also matches the element itself; only descendants count
+            if node.mem_id == element.mem_id:
+                continue
+            
+            node_class = (node.attributes.get('class') or '').lower()
+            for field, tags, keywords in site.field_rules:
+                if field not in fields and node.tag in tags and any(k in node_class for k in keywords):
+                    fields[field] = node
+            
+            if len(fields) == len(site.field_rules):
                 break
         
-        return reviews
+        return fields
     
-    def _parse_review(self, element) -> Optional[Dict]:
+    @staticmethod
+    def _parse_review_full(site: SiteConfig, element, review_date: str) -> Optional[Review]:
         """
         Parse a single review element.
         
         Args:
-            element: BeautifulSoup element containing review data
+            site: Configuration of the site the review belongs to
+            element: selectolax node containing review data
+            review_date: Date already extracted by _extract_date_only
         
         Returns:
-            Review dictionary or None
+            Review object or None
         """
-        try:
-            review = {
-                'source': 'TrustRadius',
-                'title': '',
-                'description': '',
-                'review_date': '',
-                'reviewer_name': '',
-                'rating': ''
-            }
-            
-            # Extract title
-            title_elem = element.find(['h3', 'h4', 'div'], class_=re.compile(r'title|heading', re.I))
-            if title_elem:
-                review['title'] = title_elem.get_text(strip=True)
-            
-            # Extract description
-            desc_elem = element.find('div', class_=re.compile(r'description|text|content|body', re.I))
-            if desc_elem:
-                review['description'] = desc_elem.get_text(strip=True)
-            
-            # Extract date
-            date_elem = element.find(['time', 'span', 'div'], class_=re.compile(r'date|time', re.I))
-            if date_elem:
-                review['review_date'] = date_elem.get_text(strip=True)
-                if date_elem.get('datetime'):
-                    review['review_date'] = date_elem.get('datetime')
-            
-            # Extract reviewer name
-            reviewer_elem = element.find(['span', 'div', 'a'], class_=re.compile(r'author|reviewer|name', re.I))
-            if reviewer_elem:
-                review['reviewer_name'] = reviewer_elem.get_text(strip=True)
-            
-            # Extract rating
-            rating_elem = element.find(['span', 'div'], class_=re.compile(r'rating|star', re.I))
-            if rating_elem:
-                rating_text = rating_elem.get_text(strip=True)
-                rating_match = re.search(r'(\d+(?:\.\d+)?)', rating_text)
-                if rating_match:
-                    review['rating'] = rating_match.group(1)
-            
-            if review['title'] or review['description']:
-                return review
-            
-            return None
-            
-        except Exception as e:
-            logger.warning(f"Error parsing review element: {e}")
-            return None
+        title = description = reviewer_name = rating = ''
+        fields = ReviewScraper._find_fields(site, element)
+        
+        # Extract title
+        title_elem = fields.get('title')
+        if title_elem is not None:
+            title = title_elem.text(strip=True)
+        
+        # Extract description
+        desc_elem = fields.get('description')
+        if desc_elem is not None:
+            description = desc_elem.text(strip=True)
+        
+        # Extract reviewer name
+        reviewer_elem = fields.get('reviewer')
+        if reviewer_elem is not None:
+            reviewer_name = reviewer_elem.text(strip=True)
+        
+        # Extract rating
+        rating_elem = fields.get('rating')
+        if rating_elem is not None:
+            rating_text = rating_elem.text(strip=True)
+            # Extract numeric rating
+            rating_match = NUMERIC_RATING_RE.search(rating_text)
+            if rating_match:
+                rating = rating_match.group(1)
+        
+        # Only return review if it has at least title or description
+        if title or description:
+            return Review(
+                source=site.name,
+                title=title,
+                description=description,
+                review_date=review_date,
+                reviewer_name=reviewer_name,
+                rating=rating
+            )
+        
+        return None
+
 
+# Supported review sites, keyed by lower-cased source name
+SITES = {
+    'g2': SiteConfig(
+        name='G2',
+        base_url='https://www.g2.com',
+        search_path='/search?query={query}',
+        # G2 typically has links like /products/[product-name]
+        product_link_xpath=PRODUCT_LINK_XPATH,
+        reviews_path='reviews',
+        pagination='?page={page}',
+        # Review container selector - this may need adjustment based on actual G2 structure
+        review_selector='div[class*="review"], div[class*="Review"]'
+    ),
+    'capterra': SiteConfig(
+        name='Capterra',
+        base_url='https://www.capterra.com',
+        search_path='/search?utf8=✓&query={query}',
+        product_link_xpath=CAPTERRA_PRODUCT_LINK_XPATH,
+        # Reviews are listed on the product page itself
+        reviews_path='',
+        pagination='?page={page}#reviews',
+        review_selector='div[class*="review" i], div[class*="comment" i]',
+        field_rules=CAPTERRA_FIELD_RULES,
+        fields_selector=CAPTERRA_FIELDS_SELECTOR
+    ),
+    'trustradius': SiteConfig(
+        name='TrustRadius',
+        base_url='https://www.trustradius.com',
+        search_path='/search?q={query}',
+        product_link_xpath=PRODUCT_LINK_XPATH,
+        reviews_path='reviews',
+        pagination='?page={page}',
+        review_selector='div[class*="review" i]'
+    ),
+}
 
-def get_scraper(source: str, company_name: str, start_date: datetime, end_date: datetime):
+
+def get_scraper(source: str, company_name: str, start_date: datetime, end_date: datetime,
+                refresh_cache: bool = False):
     """
     Factory function to get the appropriate scraper instance.
     
@@ -616,6 +895,7 @@ def get_scraper(source: str, company_name: str, start_date: datetime, end_date:
         company_name: Company name to search for
         start_date: Start date for filtering
         end_date: End date for filtering
+        refresh_cache: Revalidate cached pages instead of serving them as-is
     
     Returns:
         Scraper instance
@@ -623,16 +903,118 @@ def get_scraper(source: str, company_name: str, start_date: datetime, end_date:
     Raises:
         ValueError: If source is not supported
     """
-    source = source.lower()
-    
-    if source == 'g2':
-        return G2Scraper(company_name, start_date, end_date)
-    elif source == 'capterra':
-        return CapterraScraper(company_name, start_date, end_date)
-    elif source == 'trustradius':
-        return TrustRadiusScraper(company_name, start_date, end_date)
-    else:
+    site = SITES.get(source.lower())
+    
+    if site is None:
         raise ValueError(f"Unsupported source: {source}. Supported sources: G2, Capterra, TrustRadius")
+    
+    return ReviewScraper(site, company_name, start_date, end_date, refresh_cache)
+
+
+def scrape_sources(scrapers: List[BaseScraper]) -> Iterator[Review]:
+    """
+    Run several scrapers concurrently and yield their reviews as they arrive.
+    
+    Each scraper runs in its own thread, so a multi-source run takes about
+    as long as the slowest source. Reviews from different sources are
+    interleaved in arrival order. A source that fails with a scraping or
+    network error is logged and skipped; the other sources carry on.
+    
+    Args:
+        scrapers: Scraper instances to run
+    
+    Yields:
+        Review objects
+    
+    Raises:
+        ScrapingError: If every source failed
+        Exception: The first unexpected error raised by any of the scrapers
+    """
+    if len(scrapers) == 1:
+        yield from scrapers[0].scrape_reviews()
+        return
+    
+    results: queue.Queue = queue.Queue()
+    finished = object()
+    stop = threading.Event()
+    failures = []
+    
+    def run(scraper: BaseScraper):
+        try:
+            with closing(scraper.scrape_reviews()) as reviews:
+                for review in reviews:
+                    if stop.is_set():
+                        break
+                    results.put(review)
+        except (ScrapingError, requests.RequestException) as e:
+            logger.error(f"Scraping error: {e}")
+            failures.append(e)
+        except Exception as e:
+            results.put(e)
+        finally:
+            results.put(finished)
+    
+    with ThreadPoolExecutor(max_workers=len(scrapers)) as executor:
+        for scraper in scrapers:
+            executor.submit(run, scraper)
+        
+        try:
+            running = len(scrapers)
+            while running:
+                item = results.get()
+                if item is finished:
+                    running -= 1
+                elif isinstance(item, Exception):
+                    raise item
+                else:
+                    yield item
+            
+            if len(failures) == len(scrapers):
+                raise ScrapingError("None of the requested sources could be scraped")
+        finally:
+            # Let the remaining scrapers wind down before the executor joins them
+            stop.set()
+            for scraper in scrapers:
+                scraper.cancel()
+
+
+def _dump_json(obj) -> bytes:
+    """Serialize an object to indented UTF-8 JSON"""
+    return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS, default=str)
+
+
+def write_reviews_json(path: str, reviews: Iterable[Review]) -> int:
+    """
+    Stream reviews to a JSON array file as they are scraped.
+    
+    Output goes to a temporary file that only replaces the target once all
+    reviews are written, so a failed run leaves no partial output behind.
+    
+    Args:
+        path: Output JSON file path
+        reviews: Iterable of Review objects
+    
+    Returns:
+        Number of reviews written
+    """
+    tmp_path = f"{path}.tmp"
+    count = 0
+    
+    try:
+        with open(tmp_path, 'wb') as f:
+            f.write(b'[')
+            for review in reviews:
+                f.write(b',\n  ' if count else b'\n  ')
+                f.write(_dump_json(review).replace(b'\n', b'\n  '))
+                count += 1
+            f.write(b'\n]' if count else b']')
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    
+    return count
 
 
 def main():
@@ -645,6 +1027,7 @@ Examples:
   python saas_reviews_scraper.py --company_name "Salesforce" --start_date 2023-01-01 --end_date 2023-12-31 --source G2
   python saas_reviews_scraper.py --company_name "HubSpot" --start_date 2023-06-01 --end_date 2023-06-30 --source Capterra
   python saas_reviews_scraper.py --company_name "Slack" --start_date 2023-01-01 --end_date 2023-12-31 --source TrustRadius
+  python saas_reviews_scraper.py --company_name "Zoom" --start_date 2023-01-01 --end_date 2023-12-31 --source G2 Capterra TrustRadius
         """
     )
     
@@ -669,8 +1052,9 @@ Examples:
     parser.add_argument(
         '--source',
         required=True,
+        nargs='+',
         choices=['G2', 'Capterra', 'TrustRadius'],
-        help='Review source platform (G2, Capterra, or TrustRadius)'
+        help='Review source platform(s) (G2, Capterra, and/or TrustRadius); several are scraped concurrently'
     )
     
     parser.add_argument(
@@ -679,6 +1063,12 @@ Examples:
         help='Output JSON file path (default: reviews.json)'
     )
     
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Revalidate cached pages with the review site instead of serving them from the local cache'
+    )
+    
     args = parser.parse_args()
     
     try:
@@ -686,24 +1076,26 @@ Examples:
         logger.info("Validating input parameters...")
         start_date, end_date = validate_dates(args.start_date, args.end_date)
         
-        logger.info(f"Scraping reviews for '{args.company_name}' from {args.source}")
+        # Ignore repeated sources so their reviews are not written twice
+        sources = list(dict.fromkeys(args.source))
+        
+        logger.info(f"Scraping reviews for '{args.company_name}' from {', '.join(sources)}")
         logger.info(f"Date range: {args.start_date} to {args.end_date}")
         
-        # Get scraper instance
-        scraper = get_scraper(args.source, args.company_name, start_date, end_date)
+        # Get scraper instances
+        scrapers = [
+            get_scraper(source, args.company_name, start_date, end_date, args.refresh)
+            for source in sources
+        ]
         
-        # Scrape reviews
-        reviews = scraper.scrape_reviews()
+        # Scrape reviews, streaming them to the JSON file - output as array of review objects (per requirements)
+        reviews = scrape_sources(scrapers)
+        total_reviews = write_reviews_json(args.output, reviews)
         
-        if not reviews:
+        if not total_reviews:
             logger.warning(f"No reviews found for '{args.company_name}' in the specified date range")
-            reviews = []
-        
-        # Save to JSON file - output as array of review objects (per requirements)
-        with open(args.output, 'w', encoding='utf-8') as f:
-            json.dump(reviews, f, indent=2, ensure_ascii=False, default=str)
         
-        logger.info(f"Successfully saved {len(reviews)} reviews to {args.output}")
+        logger.info(f"Successfully saved {total_reviews} reviews to {args.output}")
         
         return 0
         